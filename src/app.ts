@@ -3,6 +3,7 @@ import type { Config } from "./config.js";
 import type { SessionOrchestrator } from "./orchestrator.js";
 import type { ResultStore } from "./results.js";
 import type { ApiKeyStore } from "./api-key-store.js";
+import type { ZoomTokenStore } from "./zoom-token-store.js";
 import { devRouter } from "./routes/dev.js";
 import { healthRouter } from "./routes/health.js";
 import { oauthRouter } from "./routes/oauth.js";
@@ -15,6 +16,7 @@ export function createApp(
   orchestrator: SessionOrchestrator,
   resultStore: ResultStore,
   apiKeyStore: ApiKeyStore,
+  zoomTokenStore: ZoomTokenStore,
 ): express.Express {
   const app = express();
 
@@ -41,10 +43,10 @@ export function createApp(
   });
 
   app.use(webhookRouter(config, orchestrator));
-  app.use(oauthRouter(config));
-  app.use(devRouter(config));
+  app.use(oauthRouter(config, zoomTokenStore));
+  app.use(devRouter(config, zoomTokenStore));
   app.use(resultsRouter(resultStore));
-  app.use(healthRouter(orchestrator));
+  app.use(healthRouter(orchestrator, zoomTokenStore));
   app.use(sidebarRouter(config, apiKeyStore));
 
   return app;
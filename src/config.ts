@@ -15,7 +15,11 @@ const configSchema = z.object({
     .default("true")
     .transform((v) => v === "true"),
   JWT_SECRET: z.string().default(() => crypto.randomBytes(32).toString("hex")),
-  LOG_LEVEL: z.string().default("info"),
+  LOG_LEVEL: z
+    .string()
+    .toLowerCase()
+    .pipe(z.enum(["error", "warn", "info", "debug", "trace"]))
+    .default("info"),
   PORT: z.coerce.number().int().default(8080),
 });
 
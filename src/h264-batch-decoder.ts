@@ -18,6 +18,14 @@ const FRAME_COUNT = 10;
 /** If no data arrives for this long during accumulation, abort. */
 const INACTIVITY_TIMEOUT_MS = 5_000;
 
+/**
+ * Hard cap on accumulated H264 bytes. ~4s of Zoom HD video is well under
+ * 4 MB; the cap only bites on pathological streams and bounds memory.
+ * Chunks arriving past the cap are dropped (H264 needs continuity, so we
+ * keep the prefix we have rather than evicting old chunks).
+ */
+const MAX_ACCUMULATED_BYTES = 32 * 1024 * 1024;
+
 /** How often to log a delivery-rate summary during accumulation. */
 const DIAG_LOG_INTERVAL_MS = 1_000;
 
@@ -84,6 +92,7 @@ export class H264BatchDecoder {
   private firstChunkTime: number | null = null;
   private lastChunkTime: number | null = null;
   private done = false;
+  private byteCapHit = false;
 
   // --- Diagnostic counters ---
   private chunkCount = 0;
@@ -106,6 +115,16 @@ export class H264BatchDecoder {
     }
     this.lastChunkTime = now;
 
+    if (this.byteCapHit || this.totalBytes + h264Chunk.length > MAX_ACCUMULATED_BYTES) {
+      if (!this.byteCapHit) {
+        this.byteCapHit = true;
+        console.warn(
+          `[H264Diag:${this.label}] Accumulation byte cap reached (${this.totalBytes} bytes) — dropping further chunks`,
+        );
+      }
+      return;
+    }
+
     this.chunks.push(h264Chunk);
     this.totalBytes += h264Chunk.length;
     this.chunkCount++;
@@ -162,12 +181,16 @@ export class H264BatchDecoder {
   async decode(): Promise<BatchDecodeResult> {
     this.done = true;
 
-    if (this.chunks.length === 0) {
+    // A non-empty chunk list guarantees feed() recorded both timestamps;
+    // narrowing them here lets the rest of the method use plain locals.
+    if (this.chunks.length === 0 || this.firstChunkTime === null || this.lastChunkTime === null) {
       throw new Error("No H264 data accumulated");
     }
+    const firstChunkTime = this.firstChunkTime;
+    const lastChunkTime = this.lastChunkTime;
 
     // Log batch completion diagnostics
-    const elapsedMs = this.firstChunkTime ? Date.now() - this.firstChunkTime : 0;
+    const elapsedMs = Date.now() - firstChunkTime;
     const nalSummary = Array.from(this.nalTypeCounts.entries())
       .map(([t, c]) => `${nalTypeName(t)}=${c}`)
       .join(", ");
@@ -190,15 +213,15 @@ export class H264BatchDecoder {
 
     try {
       // Run ffmpeg one-shot on the file
-      const rawFrames = await runFfmpeg(tmpPath, this.label);
+      const { data: rawData, frameCount: totalFrames } = await runFfmpeg(tmpPath, this.label);
       console.log(
-        `[H264Diag:${this.label}] FFmpeg decoded ${rawFrames.length} raw frames ` +
-        `from ${h264Data.length} bytes (${(rawFrames.length / Math.max(elapsedMs / 1000, 0.1)).toFixed(1)} effective fps)`,
+        `[H264Diag:${this.label}] FFmpeg decoded ${totalFrames} raw frames ` +
+        `from ${h264Data.length} bytes (${(totalFrames / Math.max(elapsedMs / 1000, 0.1)).toFixed(1)} effective fps)`,
       );
 
-      if (rawFrames.length < FRAME_COUNT) {
+      if (totalFrames < FRAME_COUNT) {
         throw new Error(
-          `Only decoded ${rawFrames.length} frames from ${h264Data.length} bytes ` +
+          `Only decoded ${totalFrames} frames from ${h264Data.length} bytes ` +
           `(${this.chunkCount} chunks over ${(elapsedMs / 1000).toFixed(1)}s). ` +
           `NAL types: {${nalSummary}}. Need at least ${FRAME_COUNT} frames.`,
         );
@@ -206,10 +229,16 @@ export class H264BatchDecoder {
 
       // Pick FRAME_COUNT CONSECUTIVE frames from the middle of the batch.
       // Moveris requires temporal continuity — frames MUST be consecutive.
-      const startIdx = Math.floor((rawFrames.length - FRAME_COUNT) / 2);
-      const selectedRaw = rawFrames.slice(startIdx, startIdx + FRAME_COUNT);
+      // Frames are fixed-size slots in the rawvideo output, so the selected
+      // frames are zero-copy views into it — no per-frame buffer copies.
+      const startIdx = Math.floor((totalFrames - FRAME_COUNT) / 2);
+      const selectedRaw: Buffer[] = [];
+      for (let i = 0; i < FRAME_COUNT; i++) {
+        const offset = (startIdx + i) * RAW_FRAME_SIZE;
+        selectedRaw.push(rawData.subarray(offset, offset + RAW_FRAME_SIZE));
+      }
 
-      console.log(`[H264Diag:${this.label}] Selected consecutive frames ${startIdx}-${startIdx + FRAME_COUNT - 1} out of ${rawFrames.length}`);
+      console.log(`[H264Diag:${this.label}] Selected consecutive frames ${startIdx}-${startIdx + FRAME_COUNT - 1} out of ${totalFrames}`);
 
       // Convert each raw RGB frame to 640x480 PNG
       const pngFrames = await Promise.all(
@@ -224,9 +253,9 @@ export class H264BatchDecoder {
 
       return {
         frames: pngFrames,
-        firstChunkTime: this.firstChunkTime!,
-        lastChunkTime: this.lastChunkTime!,
-        totalDecodedFrames: rawFrames.length,
+        firstChunkTime,
+        lastChunkTime,
+        totalDecodedFrames: totalFrames,
         selectedStartIndex: startIdx,
       };
     } finally {
@@ -242,14 +271,25 @@ export class H264BatchDecoder {
   }
 }
 
+interface FfmpegOutput {
+  /** Concatenated rawvideo output — frames are consecutive RAW_FRAME_SIZE slots. */
+  data: Buffer;
+  /** Number of complete frames contained in `data`. */
+  frameCount: number;
+}
+
 /**
- * Run ffmpeg on an H264 file and return all decoded raw RGB frames.
+ * Run ffmpeg on an H264 file and return the decoded raw RGB output.
+ * Callers slice individual frames out of `data` as needed.
  */
-function runFfmpeg(inputPath: string, label = "unknown"): Promise<Buffer[]> {
+function runFfmpeg(inputPath: string, label = "unknown"): Promise<FfmpegOutput> {
   return new Promise((resolve, reject) => {
     const ffmpeg = spawn("ffmpeg", [
       "-hide_banner",
       "-loglevel", "info",
+      // Let libavcodec use all cores for frame/slice-parallel decode —
+      // the default is effectively single-threaded for this input.
+      "-threads", "0",
       "-f", "h264",
       "-i", inputPath,
       "-vf", `scale=${TARGET_WIDTH}:${TARGET_HEIGHT}:force_original_aspect_ratio=decrease,pad=${TARGET_WIDTH}:${TARGET_HEIGHT}:(ow-iw)/2:(oh-ih)/2:black`,
@@ -261,10 +301,12 @@ function runFfmpeg(inputPath: string, label = "unknown"): Promise<Buffer[]> {
     });
 
     const outputChunks: Buffer[] = [];
+    let outputLength = 0;
     let stderrOutput = "";
 
     ffmpeg.stdout.on("data", (chunk: Buffer) => {
       outputChunks.push(chunk);
+      outputLength += chunk.length;
     });
 
     ffmpeg.stderr.on("data", (data: Buffer) => {
@@ -277,28 +319,22 @@ function runFfmpeg(inputPath: string, label = "unknown"): Promise<Buffer[]> {
         console.log(`[H264Diag:${label}] ffmpeg stderr (exit=${code}):\n${stderrOutput.trim()}`);
       }
 
-      // Concatenate all output and split into frames
-      const allOutput = Buffer.concat(outputChunks);
-      const frames: Buffer[] = [];
-      let offset = 0;
-
-      while (offset + RAW_FRAME_SIZE <= allOutput.length) {
-        frames.push(Buffer.from(allOutput.subarray(offset, offset + RAW_FRAME_SIZE)));
-        offset += RAW_FRAME_SIZE;
-      }
+      // Concatenate all output; frames are fixed-size slots within it
+      const allOutput = Buffer.concat(outputChunks, outputLength);
+      const frameCount = Math.floor(allOutput.length / RAW_FRAME_SIZE);
 
-      const remainderBytes = allOutput.length - offset;
+      const remainderBytes = allOutput.length - frameCount * RAW_FRAME_SIZE;
       console.log(
-        `[H264Diag:${label}] ffmpeg output: ${allOutput.length} bytes → ${frames.length} frames ` +
+        `[H264Diag:${label}] ffmpeg output: ${allOutput.length} bytes → ${frameCount} frames ` +
         `(${RAW_FRAME_SIZE} bytes/frame, remainder=${remainderBytes} bytes)`,
       );
 
-      if (frames.length === 0 && code !== 0) {
+      if (frameCount === 0 && code !== 0) {
         reject(new Error(`ffmpeg exited with code ${code}, decoded 0 frames. Output size: ${allOutput.length} bytes`));
         return;
       }
 
-      resolve(frames);
+      resolve({ data: allOutput, frameCount });
     });
 
     ffmpeg.on("error", (err) => {
@@ -4,6 +4,7 @@ import { createApp } from "./app.js";
 import { SessionOrchestrator } from "./orchestrator.js";
 import { InMemoryResultStore } from "./results.js";
 import { InMemoryApiKeyStore } from "./api-key-store.js";
+import { InMemoryZoomTokenStore } from "./zoom-token-store.js";
 import { SidebarWsServer } from "./sidebar-ws.js";
 
 const config = getConfig();
@@ -22,16 +23,17 @@ const LOG_LEVEL_MAP: Record<string, typeof rtms.LogLevel[keyof typeof rtms.LogLe
   trace: rtms.LogLevel.TRACE,
 };
 rtms.configureLogger({
-  level: rtms.LogLevel.TRACE,
+  level: LOG_LEVEL_MAP[config.LOG_LEVEL] ?? rtms.LogLevel.INFO,
   format: rtms.LogFormat.PROGRESSIVE,
   enabled: true,
 });
 
 const resultStore = new InMemoryResultStore();
 const apiKeyStore = new InMemoryApiKeyStore();
+const zoomTokenStore = new InMemoryZoomTokenStore();
 const orchestrator = new SessionOrchestrator(config, resultStore);
 
-const app = createApp(config, orchestrator, resultStore, apiKeyStore);
+const app = createApp(config, orchestrator, resultStore, apiKeyStore, zoomTokenStore);
 
 const server = app.listen(config.PORT, () => {
   console.log(`Listening on port ${config.PORT}`);
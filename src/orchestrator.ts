@@ -8,6 +8,7 @@ import type { Config } from "./config.js";
 import type { ResultStore } from "./results.js";
 import { RTMSClient } from "./rtms-client.js";
 import { H264BatchDecoder } from "./h264-batch-decoder.js";
+import { isQualityFrame } from "./frame-processor.js";
 import type { ParticipantResult } from "./types.js";
 
 /** How often to check if the batch decoder is ready (ms). */
@@ -17,8 +18,45 @@ const ACCUMULATION_TIMEOUT_MS = 30_000;
 /** Gap in H264 chunks that indicates camera was off and came back on (ms). */
 const CAMERA_RETURN_THRESHOLD_MS = 5_000;
 
+/** Max Moveris submissions in flight across all sessions. */
+const MAX_CONCURRENT_SUBMISSIONS = 16;
+
+/** Max cached per-API-key LivenessClients before the oldest is evicted. */
+const MAX_CACHED_LIVENESS_CLIENTS = 100;
+
 export class TooManySessions extends Error {}
 
+/**
+ * FIFO concurrency gate for outbound Moveris submissions.
+ * Keeps a webinar-sized burst of participants from firing 50+
+ * simultaneous HTTPS POSTs; excess submissions queue in order.
+ */
+class SubmissionGate {
+  private active = 0;
+  private waiters: Array<() => void> = [];
+
+  constructor(private limit: number) {}
+
+  acquire(): Promise<void> {
+    if (this.active < this.limit) {
+      this.active++;
+      return Promise.resolve();
+    }
+    return new Promise<void>((resolve) => this.waiters.push(resolve));
+  }
+
+  release(): void {
+    // Hand the slot directly to the next waiter so a fresh acquire
+    // cannot jump the queue between release and wake-up.
+    const next = this.waiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.active--;
+    }
+  }
+}
+
 interface ParticipantState {
   decoder: H264BatchDecoder;
   done: boolean;
@@ -69,6 +107,11 @@ export class SessionOrchestrator {
   private config: Config;
   private resultStore: ResultStore;
   private defaultLivenessClient: LivenessClient | null = null;
+  // One client per API key — reused across sessions so the underlying
+  // HTTP connections to Moveris stay warm instead of paying a fresh
+  // TCP+TLS handshake for every meeting.
+  private livenessClients = new Map<string, LivenessClient>();
+  private submissionGate = new SubmissionGate(MAX_CONCURRENT_SUBMISSIONS);
   onProgress: ProgressCallback | null = null;
   onStage: StageCallback | null = null;
   onResult: ResultCallback | null = null;
@@ -111,19 +154,32 @@ export class SessionOrchestrator {
   }
 
   startSession(meetingUuid: string, rtmsPayload: Record<string, any>, apiKey?: string, excludeUserId?: string, rescanIntervalMs?: number): void {
+    if (this.sessions.has(meetingUuid)) {
+      console.log(`Session already active — ignoring duplicate: ${meetingUuid}`);
+      return;
+    }
     if (this.sessions.size >= this.config.MAX_CONCURRENT_SESSIONS) {
       throw new TooManySessions(
         `Cannot start session ${meetingUuid}: max ${this.config.MAX_CONCURRENT_SESSIONS} concurrent sessions`,
       );
     }
-    if (this.sessions.has(meetingUuid)) {
-      console.log(`Session already active — ignoring duplicate: ${meetingUuid}`);
-      return;
-    }
 
     let livenessClient: LivenessClient;
     if (apiKey) {
-      livenessClient = new LivenessClient({ apiKey, enableRetry: true });
+      let cached = this.livenessClients.get(apiKey);
+      if (!cached) {
+        // Bound the cache — Maps iterate in insertion order, so the first
+        // key is the oldest entry.
+        if (this.livenessClients.size >= MAX_CACHED_LIVENESS_CLIENTS) {
+          const oldest = this.livenessClients.keys().next().value;
+          if (oldest !== undefined) {
+            this.livenessClients.delete(oldest);
+          }
+        }
+        cached = new LivenessClient({ apiKey, enableRetry: true });
+        this.livenessClients.set(apiKey, cached);
+      }
+      livenessClient = cached;
     } else if (this.defaultLivenessClient) {
       livenessClient = this.defaultLivenessClient;
     } else {
@@ -139,6 +195,7 @@ export class SessionOrchestrator {
       rtmsPayload,
       this.resultStore,
       livenessClient,
+      this.submissionGate,
       (reason: string) => this.onSessionError(meetingUuid, reason),
       this.onProgress,
       this.onStage,
@@ -194,6 +251,7 @@ class Session {
   private meetingUuid: string;
   private resultStore: ResultStore;
   private livenessClient: LivenessClient;
+  private submissionGate: SubmissionGate;
   private onSessionError: (reason: string) => void;
   private onProgress: ProgressCallback | null;
   private onStage: StageCallback | null;
@@ -208,6 +266,7 @@ class Session {
     rtmsPayload: Record<string, any>,
     resultStore: ResultStore,
     livenessClient: LivenessClient,
+    submissionGate: SubmissionGate,
     onSessionError: (reason: string) => void,
     onProgress: ProgressCallback | null,
     onStage: StageCallback | null,
@@ -218,6 +277,7 @@ class Session {
     this.meetingUuid = meetingUuid;
     this.resultStore = resultStore;
     this.livenessClient = livenessClient;
+    this.submissionGate = submissionGate;
     this.onSessionError = onSessionError;
     this.onProgress = onProgress;
     this.onStage = onStage;
@@ -321,6 +381,8 @@ class Session {
 
     // Skip excluded user (host self-exclusion)
     if (this.excludeUserId && participantId === this.excludeUserId) return;
+
+    const now = Date.now();
     let state = this.participants.get(participantId);
 
     if (!state) {
@@ -343,14 +405,13 @@ class Session {
         userName: displayName,
         checkInterval,
         timeout,
-        lastChunkTime: Date.now(),
+        lastChunkTime: now,
       };
       this.participants.set(participantId, state);
       console.log(`Spawned batch collector — meeting=${this.meetingUuid} participant=${participantId} name=${displayName}`);
     }
 
     if (state.done) {
-      const now = Date.now();
       const gap = now - state.lastChunkTime;
       state.lastChunkTime = now;
       if (gap >= CAMERA_RETURN_THRESHOLD_MS) {
@@ -361,9 +422,16 @@ class Session {
       return;
     }
 
-    state.lastChunkTime = Date.now();
+    state.lastChunkTime = now;
     // Feed raw H264 data into the batch decoder
     state.decoder.feed(h264Data);
+
+    // Start decoding the moment the accumulation window is full instead of
+    // waiting for the next poll tick (up to 250ms of added latency).
+    // The interval keeps running only to push progress and catch timeouts.
+    if (state.decoder.isReady()) {
+      this.checkAccumulation(participantId);
+    }
   }
 
   /**
@@ -439,6 +507,30 @@ class Session {
         `frames=${pngFrames.length} avgPngSize=${avgPngSize}B`,
       );
 
+      // Quality-gate the batch before paying for a Moveris check. Frames are
+      // consecutive, so the middle frame is representative: a black or badly
+      // blurred batch (camera off, mid-toggle) gets rejected here instead of
+      // burning the base64 conversion and an API call on frames that cannot
+      // verify.
+      const midFrame = pngFrames[Math.floor(pngFrames.length / 2)];
+      if (!(await isQualityFrame(midFrame))) {
+        console.warn(
+          `Low-quality batch — skipping Moveris submission for participant ${participantId} in meeting ${this.meetingUuid}`,
+        );
+        const errorResult: ParticipantResult = {
+          meetingUuid: this.meetingUuid,
+          participantId,
+          result: null,
+          completedAt: new Date(),
+          error: "low_quality_frames",
+        };
+        this.resultStore.setResult(this.meetingUuid, participantId, errorResult);
+        this.onResult?.(this.meetingUuid, participantId, errorResult);
+        // Rescan later in case the camera comes back with usable video
+        this.scheduleRescan(participantId, state.userName);
+        return;
+      }
+
       // Reconstruct per-frame timestamps from accumulation timing.
       // The batch spans firstChunkTime..lastChunkTime with totalDecodedFrames frames.
       // Selected frames start at selectedStartIndex, so each frame's real time is:
@@ -486,10 +578,16 @@ class Session {
     const userName = state?.userName ?? participantId;
 
     try {
-      const result = await this.livenessClient.fastCheck(frames, {
-        sessionId: generateSessionId(),
-        source: "live",
-      });
+      await this.submissionGate.acquire();
+      let result;
+      try {
+        result = await this.livenessClient.fastCheck(frames, {
+          sessionId: generateSessionId(),
+          source: "live",
+        });
+      } finally {
+        this.submissionGate.release();
+      }
 
       const participantResult: ParticipantResult = {
         meetingUuid: this.meetingUuid,
@@ -1,12 +1,12 @@
 import { Router } from "express";
 import type { Config } from "../config.js";
-import { getZoomToken } from "./oauth.js";
+import type { ZoomTokenStore } from "../zoom-token-store.js";
 
-export function devRouter(config: Config): Router {
+export function devRouter(config: Config, zoomTokenStore: ZoomTokenStore): Router {
   const router = Router();
 
   router.post("/dev/start-rtms/:meetingId", async (req, res) => {
-    const token = getZoomToken();
+    const token = zoomTokenStore.get();
     if (!token) {
       res.status(401).json({
         detail:
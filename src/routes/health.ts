@@ -1,16 +1,22 @@
 import { Router } from "express";
 import type { SessionOrchestrator } from "../orchestrator.js";
-import { getZoomToken } from "./oauth.js";
+import type { ZoomTokenStore } from "../zoom-token-store.js";
 
-export function healthRouter(orchestrator: SessionOrchestrator): Router {
+// Static part of the health envelope — /health is polled every second by
+// load balancers, so only the live counters are built per request.
+const HEALTH_BASE = {
+  status: "ok",
+  version: "0.1.0",
+} as const;
+
+export function healthRouter(orchestrator: SessionOrchestrator, zoomTokenStore: ZoomTokenStore): Router {
   const router = Router();
 
   router.get("/health", (_req, res) => {
     res.json({
-      status: "ok",
-      version: "0.1.0",
+      ...HEALTH_BASE,
       active_sessions: orchestrator.activeSessionCount,
-      zoom_token: getZoomToken() ? "present" : "missing",
+      zoom_token: zoomTokenStore.get() ? "present" : "missing",
     });
   });
 
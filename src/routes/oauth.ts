@@ -1,16 +1,16 @@
 import { Router } from "express";
 import type { Config } from "../config.js";
+import type { ZoomTokenStore } from "../zoom-token-store.js";
 
-// In-memory token store (production should use a database).
-let zoomToken: Record<string, unknown> | null = null;
-
-export function getZoomToken(): Record<string, unknown> | null {
-  return zoomToken;
-}
-
-export function oauthRouter(config: Config): Router {
+export function oauthRouter(config: Config, zoomTokenStore: ZoomTokenStore): Router {
   const router = Router();
 
+  // Client credentials never change at runtime — encode the Basic auth
+  // header once instead of on every OAuth redirect.
+  const basicAuth = `Basic ${Buffer.from(
+    `${config.ZOOM_CLIENT_ID}:${config.ZOOM_CLIENT_SECRET}`,
+  ).toString("base64")}`;
+
   router.get("/oauth/callback", async (req, res) => {
     const code = (req.query.code as string) ?? "";
     if (!code) {
@@ -26,10 +26,6 @@ export function oauthRouter(config: Config): Router {
       redirectUri = redirectUri.replace("http://", "https://");
     }
 
-    const creds = Buffer.from(
-      `${config.ZOOM_CLIENT_ID}:${config.ZOOM_CLIENT_SECRET}`,
-    ).toString("base64");
-
     try {
       const resp = await fetch(
         `https://zoom.us/oauth/token?${new URLSearchParams({
@@ -39,12 +35,12 @@ export function oauthRouter(config: Config): Router {
         })}`,
         {
           method: "POST",
-          headers: { Authorization: `Basic ${creds}` },
+          headers: { Authorization: basicAuth },
         },
       );
 
       if (resp.ok) {
-        zoomToken = (await resp.json()) as Record<string, unknown>;
+        zoomTokenStore.set((await resp.json()) as Record<string, unknown>);
         console.log("Zoom OAuth token obtained successfully");
       } else {
         console.warn(`Token exchange failed: ${resp.status} ${await resp.text()}`);
@@ -9,51 +9,59 @@ export function webhookRouter(
 ): Router {
   const router = Router();
 
-  // Use the SDK's built-in webhook handler for URL validation + signature verification.
-  // The SDK reads ZOOM_WEBHOOK_SECRET_TOKEN from env for HMAC validation.
-  const handler = rtms.createWebhookHandler(
-    (payload: Record<string, any>) => {
-      const event = payload.event as string;
+  function handleRtmsStarted(payload: Record<string, any>): void {
+    const rtmsPayload = payload.payload as Record<string, any> | undefined;
+    const meetingUuid = rtmsPayload?.meeting_uuid as string;
 
-      if (event === "meeting.rtms_started") {
-        const rtmsPayload = payload.payload as Record<string, any> | undefined;
-        const meetingUuid = rtmsPayload?.meeting_uuid as string;
-
-        if (meetingUuid && rtmsPayload) {
-          try {
-            // Check if the sidebar registered a pending session with a user-provided key
-            let apiKey: string | undefined;
-            let excludeUserId: string | undefined;
-            let rescanIntervalMs: number | undefined;
-            if (orchestrator.hasPendingSession(meetingUuid)) {
-              const pending = orchestrator.consumePendingSession(meetingUuid);
-              apiKey = pending?.apiKey;
-              excludeUserId = pending?.excludeUserId;
-              rescanIntervalMs = pending?.rescanIntervalMs;
-              console.log(`Using sidebar-provided API key for meeting=${meetingUuid}`);
-            } else if (!config.AUTO_START_RTMS) {
-              // Sidebar-only mode: no pending session means no scan requested
-              console.log(`No pending session and AUTO_START_RTMS=false — ignoring meeting=${meetingUuid}`);
-              return;
-            }
-            // Pass the raw webhook payload directly — the SDK's join() expects this format.
-            orchestrator.startSession(meetingUuid, rtmsPayload, apiKey, excludeUserId, rescanIntervalMs);
-          } catch (err) {
-            console.error(`Failed to start RTMS session: ${err}`);
-          }
-        } else {
-          console.error(`Missing RTMS payload or meeting_uuid in webhook`);
+    if (meetingUuid && rtmsPayload) {
+      try {
+        // Check if the sidebar registered a pending session with a user-provided key
+        let apiKey: string | undefined;
+        let excludeUserId: string | undefined;
+        let rescanIntervalMs: number | undefined;
+        if (orchestrator.hasPendingSession(meetingUuid)) {
+          const pending = orchestrator.consumePendingSession(meetingUuid);
+          apiKey = pending?.apiKey;
+          excludeUserId = pending?.excludeUserId;
+          rescanIntervalMs = pending?.rescanIntervalMs;
+          console.log(`Using sidebar-provided API key for meeting=${meetingUuid}`);
+        } else if (!config.AUTO_START_RTMS) {
+          // Sidebar-only mode: no pending session means no scan requested
+          console.log(`No pending session and AUTO_START_RTMS=false — ignoring meeting=${meetingUuid}`);
+          return;
         }
+        // Pass the raw webhook payload directly — the SDK's join() expects this format.
+        orchestrator.startSession(meetingUuid, rtmsPayload, apiKey, excludeUserId, rescanIntervalMs);
+      } catch (err) {
+        console.error(`Failed to start RTMS session: ${err}`);
       }
+    } else {
+      console.error(`Missing RTMS payload or meeting_uuid in webhook`);
+    }
+  }
 
-      if (event === "meeting.rtms_stopped") {
-        const meetingUuid = payload.payload?.meeting_uuid as string;
-        const stopReason = payload.payload?.stop_reason as number | undefined;
-        if (meetingUuid) {
-          console.log(`RTMS stopped — meeting=${meetingUuid} stop_reason=${stopReason ?? "unknown"}`);
-          orchestrator.stopSession(meetingUuid);
-        }
-      }
+  function handleRtmsStopped(payload: Record<string, any>): void {
+    const rtmsPayload = payload.payload as Record<string, any> | undefined;
+    const meetingUuid = rtmsPayload?.meeting_uuid as string;
+    const stopReason = rtmsPayload?.stop_reason as number | undefined;
+    if (meetingUuid) {
+      console.log(`RTMS stopped — meeting=${meetingUuid} stop_reason=${stopReason ?? "unknown"}`);
+      orchestrator.stopSession(meetingUuid);
+    }
+  }
+
+  // One hash lookup per event instead of an equality chain; unknown events
+  // fall through as no-ops.
+  const eventHandlers: Record<string, (payload: Record<string, any>) => void> = {
+    "meeting.rtms_started": handleRtmsStarted,
+    "meeting.rtms_stopped": handleRtmsStopped,
+  };
+
+  // Use the SDK's built-in webhook handler for URL validation + signature verification.
+  // The SDK reads ZOOM_WEBHOOK_SECRET_TOKEN from env for HMAC validation.
+  const handler = rtms.createWebhookHandler(
+    (payload: Record<string, any>) => {
+      eventHandlers[payload.event as string]?.(payload);
     },
     "/zoom/webhook",
   );
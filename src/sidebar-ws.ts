@@ -16,6 +16,17 @@ interface ClientInfo {
   userId: string;
 }
 
+// Pre-serialized error payloads — the text never varies, so avoid a
+// JSON.stringify per send.
+const ERR_NO_API_KEY = JSON.stringify({
+  type: "error",
+  message: "No API key configured. Please add your Moveris API key first.",
+});
+const ERR_NO_SESSION = JSON.stringify({
+  type: "error",
+  message: "Cannot retry — no active session for this meeting.",
+});
+
 /** Manages WebSocket connections grouped by meeting UUID. */
 export class SidebarWsServer {
   private wss: WebSocketServer;
@@ -121,7 +132,7 @@ export class SidebarWsServer {
         // Look up the user's API key and pass it to the pending session
         const apiKey = this.apiKeyStore.get(info.userId);
         if (!apiKey) {
-          ws.send(JSON.stringify({ type: "error", message: "No API key configured. Please add your Moveris API key first." }));
+          ws.send(ERR_NO_API_KEY);
           return;
         }
         // Host can opt out of being scanned to save tokens
@@ -146,7 +157,7 @@ export class SidebarWsServer {
         if (ok) {
           console.log(`Sidebar requested retry — meeting=${info.meetingUuid} participant=${participantId}`);
         } else {
-          ws.send(JSON.stringify({ type: "error", message: "Cannot retry — no active session for this meeting." }));
+          ws.send(ERR_NO_SESSION);
         }
         break;
       }
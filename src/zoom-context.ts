@@ -18,6 +18,20 @@ export interface ZoomContext {
  *
  * Reference: https://github.com/zoom/zoomapps-advancedsample-react/blob/main/backend/util/zoom-helpers.js
  */
+// The AES key is a pure function of the client secret, which is fixed for
+// the process lifetime — derive it once instead of per decryption.
+let keyCache: { secret: string; key: Buffer } | null = null;
+
+function deriveKey(clientSecret: string): Buffer {
+  if (!keyCache || keyCache.secret !== clientSecret) {
+    keyCache = {
+      secret: clientSecret,
+      key: crypto.createHash("sha256").update(clientSecret).digest(),
+    };
+  }
+  return keyCache.key;
+}
+
 export function decryptZoomContext(context: string, clientSecret: string): ZoomContext {
   let buf = Buffer.from(context, "base64");
   if (buf.length < 24) {
@@ -44,8 +58,8 @@ export function decryptZoomContext(context: string, clientSecret: string): ZoomC
   // 4. Auth tag is the remaining bytes after cipher text (16 bytes)
   const tag = buf.subarray(cipherLength);
 
-  // 5. Derive key from client secret via SHA-256
-  const key = crypto.createHash("sha256").update(clientSecret).digest();
+  // 5. Derive key from client secret via SHA-256 (cached per secret)
+  const key = deriveKey(clientSecret);
 
   // 6. Decrypt
   const decipher = crypto
@@ -54,8 +68,9 @@ export function decryptZoomContext(context: string, clientSecret: string): ZoomC
     .setAuthTag(tag)
     .setAutoPadding(false);
 
-  const decrypted = decipher.update(cipherText, undefined, "utf-8") + decipher.final("utf-8");
-  const payload = JSON.parse(decrypted);
+  // Stay in buffers until the end — one concat, one UTF-8 decode.
+  const decrypted = Buffer.concat([decipher.update(cipherText), decipher.final()]);
+  const payload = JSON.parse(decrypted.toString("utf-8"));
 
   return {
     typ: payload.typ,
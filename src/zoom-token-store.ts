@@ -0,0 +1,17 @@
+export interface ZoomTokenStore {
+  set(token: Record<string, unknown>): void;
+  get(): Record<string, unknown> | null;
+}
+
+// In-memory token store (production should use a database).
+export class InMemoryZoomTokenStore implements ZoomTokenStore {
+  private token: Record<string, unknown> | null = null;
+
+  set(token: Record<string, unknown>): void {
+    this.token = token;
+  }
+
+  get(): Record<string, unknown> | null {
+    return this.token;
+  }
+}